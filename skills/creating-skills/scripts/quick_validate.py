@@ -8,6 +8,11 @@ import os
 import re
 from pathlib import Path
 
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+NAME_RE = re.compile(r'name:\s*(.+)')
+DESCRIPTION_RE = re.compile(r'description:\s*(.+)')
+HYPHEN_CASE_RE = re.compile(r'^[a-z0-9-]+$')
+
 def validate_skill(skill_path):
     """Basic validation of a skill"""
     skill_path = Path(skill_path)
@@ -23,7 +28,7 @@ def validate_skill(skill_path):
         return False, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
@@ -36,17 +41,17 @@ def validate_skill(skill_path):
         return False, "Missing 'description' in frontmatter"
 
     # Extract name for validation
-    name_match = re.search(r'name:\s*(.+)', frontmatter)
+    name_match = NAME_RE.search(frontmatter)
     if name_match:
         name = name_match.group(1).strip()
         # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not HYPHEN_CASE_RE.match(name):
             return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
         if name.startswith('-') or name.endswith('-') or '--' in name:
             return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
 
     # Extract and validate description
-    desc_match = re.search(r'description:\s*(.+)', frontmatter)
+    desc_match = DESCRIPTION_RE.search(frontmatter)
     if desc_match:
         description = desc_match.group(1).strip()
         # Check for angle brackets